@@ -1,9 +1,12 @@
 """Rotation class for props that supports both cardinal directions and arbitrary angles."""
 
 import math
+import random
 from enum import Enum
 from typing import Union, Optional
 
+_QUARTER_TURNS_PER_RADIAN = 2.0 / math.pi
+
 class Rotation:
     """Rotation angles for props supporting both cardinal directions and arbitrary angles.
     
@@ -33,6 +36,7 @@ class Rotation:
             degrees: Rotation angle in degrees
         """
         self._degrees = degrees % 360
+        self._radians = math.radians(self._degrees)
         
     @property
     def degrees(self) -> float:
@@ -43,18 +47,22 @@ class Rotation:
     def degrees(self, value: float) -> None:
         """Set the rotation angle in degrees."""
         self._degrees = value % 360
+        self._radians = math.radians(self._degrees)
         
     @property
     def radians(self) -> float:
-        """Get the rotation angle in radians."""
-        return math.radians(self._degrees)
+        """Get the rotation angle in radians (computed when the angle is set)."""
+        return self._radians
         
     @radians.setter 
     def radians(self, value: float) -> None:
         """Set the rotation angle in radians."""
-        self._degrees = math.degrees(value) % 360
+        self.degrees = math.degrees(value)
         
     def __eq__(self, other: object) -> bool:
+        # Most comparisons are against the shared cardinal constants
+        if self is other:
+            return True
         if not isinstance(other, Rotation):
             return NotImplemented
         return abs((self._degrees - other._degrees) % 360) < 0.001
@@ -100,34 +108,27 @@ class Rotation:
         Returns:
             Nearest cardinal Rotation (ROT_0, ROT_90, etc.)
         """
-        # Convert to degrees and normalize to 0-360
-        degrees = math.degrees(radians) % 360
-        
-        # Find nearest 90-degree increment
-        nearest = round(degrees / 90) * 90
-        
-        # Map to cardinal rotations
-        if nearest == 0 or nearest == 360:
-            return cls.ROT_0
-        elif nearest == 90:
-            return cls.ROT_90
-        elif nearest == 180:
-            return cls.ROT_180
-        else:  # 270
-            return cls.ROT_270
+        # Count quarter turns; masking the low two bits wraps negative and
+        # multi-turn angles onto the four cardinal rotations
+        return _CARDINAL_ROTATIONS[round(radians * _QUARTER_TURNS_PER_RADIAN) & 3]
             
     @classmethod
-    def random_cardinal_rotation(cls) -> 'Rotation':
+    def random_cardinal_rotation(cls, rng: Optional[random.Random] = None) -> 'Rotation':
         """Get a random cardinal rotation (0, 90, 180, or 270 degrees).
         
+        Args:
+            rng: Random generator to draw from (defaults to the global one)
+            
         Returns:
             Random cardinal Rotation (ROT_0, ROT_90, ROT_180, or ROT_270)
         """
-        import random
-        return random.choice([cls.ROT_0, cls.ROT_90, cls.ROT_180, cls.ROT_270])
+        return _CARDINAL_ROTATIONS[(rng or random).randrange(4)]
 
 # Initialize cardinal direction constants
 Rotation.ROT_0 = Rotation(0)
 Rotation.ROT_90 = Rotation(90) 
 Rotation.ROT_180 = Rotation(180)
 Rotation.ROT_270 = Rotation(270)
+
+# Cardinal rotations indexed by quarter turns, for random picks
+_CARDINAL_ROTATIONS = (Rotation.ROT_0, Rotation.ROT_90, Rotation.ROT_180, Rotation.ROT_270)
@@ -2,6 +2,7 @@
 
 from abc import ABC
 import math
+import numpy as np
 import skia
 from typing import Any, List, Optional, Protocol, Sequence, TypeAlias
 from dungeongen.graphics.aliases import Point
@@ -9,6 +10,11 @@ from dungeongen.graphics.math import Matrix2D
 from dungeongen.graphics.rotation import Rotation
 from dungeongen.constants import CELL_SIZE
 
+# Cell values of an accelerated containment mask
+MASK_OUTSIDE = 0
+MASK_INSIDE = 1
+MASK_BOUNDARY = 2
+
 class Shape(ABC):
 
     """Protocol defining the interface for shapes."""
@@ -29,6 +35,14 @@ class Shape(ABC):
         """Check if this shape intersects with another shape."""
         return shape_intersects(self, other)
     
+    def accelerate(self, resolution: int = 128) -> None:
+        """Prepare this shape for many repeated contains() calls.
+        
+        Simple shapes already have constant time containment tests, so the
+        base implementation does nothing.
+        """
+        pass
+    
     @property
     def bounds(self) -> 'Rectangle':
         """Get the bounding rectangle that encompasses this shape."""
@@ -86,45 +100,56 @@ class ShapeGroup(Shape):
         self._bounds_dirty = True
         self._cached_path: skia.Path | None = None
         self._inflate: float = 0.0
+        self._mask: np.ndarray | None = None
+        self._mask_resolution = 0
+        self._mask_scale = 1.0
+        self._mask_x = 0.0
+        self._mask_y = 0.0
 
     @property
     def inflate(self) -> float:
         """Get the inflation amount for this shape group."""
         return self._inflate
 
+    def _shapes_changed(self) -> None:
+        """Drop the cached bounds, path and raster after the shapes change."""
+        self._bounds_dirty = True
+        self._cached_path = None
+        self._mask = None
+
     def add_include(self, shape: Shape) -> None:
         """Add a shape to the includes list."""
         self.includes.append(shape)
-        self._bounds_dirty = True
+        self._shapes_changed()
 
     def remove_include(self, shape: Shape) -> None:
         """Remove a shape from the includes list."""
         if shape in self.includes:
             self.includes.remove(shape)
-            self._bounds_dirty = True
+            self._shapes_changed()
             
     def remove_include_at(self, index: int) -> None:
         """Remove a shape from the includes list at the specified index."""
         if 0 <= index < len(self.includes):
             self.includes.pop(index)
-            self._bounds_dirty = True
+            self._shapes_changed()
 
     def add_exclude(self, shape: Shape) -> None:
         """Add a shape to the excludes list."""
         self.excludes.append(shape)
-        self._bounds_dirty = True
+        self._shapes_changed()
 
     def remove_exclude(self, shape: Shape) -> None:
         """Remove a shape from the excludes list."""
         if shape in self.excludes:
             self.excludes.remove(shape)
-            self._bounds_dirty = True
+            self._shapes_changed()
             
     def remove_exclude_at(self, index: int) -> None:
         """Remove a shape from the excludes list at the specified index."""
         if 0 <= index < len(self.excludes):
             self.excludes.pop(index)
-            self._bounds_dirty = True
+            self._shapes_changed()
     
     @classmethod
     def combine(cls, shapes: Sequence[Shape]) -> 'ShapeGroup':
@@ -182,8 +207,71 @@ class ShapeGroup(Shape):
             
         return cls(includes=[circle], excludes=[rect]) #type: ignore
     
+    def accelerate(self, resolution: int = 128) -> None:
+        """Bake a coarse inside/outside raster to speed up contains().
+        
+        The group's path is rasterized with antialiasing into a grid of at most
+        resolution x resolution cells. Cells in fully covered neighbourhoods
+        are marked inside, cells in uncovered neighbourhoods outside, and all
+        others are marked as boundary. contains()
+        answers inside/outside cells with a single lookup and falls back to
+        the exact test on boundary cells. The raster is discarded whenever the
+        group is modified.
+        
+        Args:
+            resolution: Number of cells along the longer side of the bounds
+        """
+        if self._mask is not None and self._mask_resolution == resolution:
+            return
+        bounds = self.bounds
+        if not self.is_valid or bounds.width <= 0 or bounds.height <= 0:
+            return
+        
+        scale = resolution / max(bounds.width, bounds.height)
+        width = max(1, math.ceil(bounds.width * scale))
+        height = max(1, math.ceil(bounds.height * scale))
+        
+        # Rasterize path coverage into an 8-bit alpha mask
+        surface = skia.Surface.MakeRaster(skia.ImageInfo.MakeA8(width, height))
+        canvas = surface.getCanvas()
+        canvas.scale(scale, scale)
+        canvas.translate(-bounds.x, -bounds.y)
+        canvas.drawPath(self.path, skia.Paint(AntiAlias=True))
+        coverage = surface.makeImageSnapshot().toarray()
+        
+        # A cell is only inside (or outside) if its whole 3x3 neighbourhood is
+        # fully covered (or uncovered); antialiasing rounds thin slivers of
+        # coverage down to zero, so a single cell can't be trusted on its own
+        padded = np.pad(coverage, 1)
+        rows, cols = coverage.shape
+        lowest = coverage.copy()
+        highest = coverage.copy()
+        for dy in range(3):
+            for dx in range(3):
+                window = padded[dy:dy + rows, dx:dx + cols]
+                np.minimum(lowest, window, out=lowest)
+                np.maximum(highest, window, out=highest)
+        
+        mask = np.full(coverage.shape, MASK_BOUNDARY, dtype=np.uint8)
+        mask[lowest == 255] = MASK_INSIDE
+        mask[highest == 0] = MASK_OUTSIDE
+        
+        self._mask = mask
+        self._mask_resolution = resolution
+        self._mask_scale = scale
+        self._mask_x = bounds.x
+        self._mask_y = bounds.y
+    
     def contains(self, px: float, py: float) -> bool:
         """Check if a point is contained within this shape group."""
+        mask = self._mask
+        if mask is not None:
+            ix = math.floor((px - self._mask_x) * self._mask_scale)
+            iy = math.floor((py - self._mask_y) * self._mask_scale)
+            if 0 <= iy < mask.shape[0] and 0 <= ix < mask.shape[1]:
+                value = mask[iy, ix]
+                if value != MASK_BOUNDARY:
+                    return value == MASK_INSIDE
         return (
             any(shape.contains(px, py) for shape in self.includes) and
             not any(shape.contains(px, py) for shape in self.excludes)
@@ -236,7 +324,7 @@ class ShapeGroup(Shape):
             shape.rotate(rotation)
         for shape in self.excludes:
             shape.rotate(rotation)
-        self._bounds_dirty = True
+        self._shapes_changed()
         return self
     
     def translate(self, dx: float, dy: float) -> 'ShapeGroup':
@@ -245,7 +333,7 @@ class ShapeGroup(Shape):
             shape.translate(dx, dy)
         for shape in self.excludes:
             shape.translate(dx, dy)
-        self._bounds_dirty = True
+        self._shapes_changed()
         return self
     
     def make_copy(self) -> 'ShapeGroup':
@@ -342,6 +430,11 @@ class Rectangle(Shape):
         self._inflated_height = height + 2 * inflate
         self._cached_path: skia.Path | None = None    
     
+    @property
+    def inflate(self) -> float:
+        """Get the inflation amount for this rectangle."""
+        return self._inflate
+    
     @property
     def is_valid(self) -> bool:
         """Check if this rectangle is valid (has positive width and height)."""
@@ -378,12 +471,10 @@ class Rectangle(Shape):
         dy = max(0, abs(py - (self._inflated_y + self._inflated_height / 2)) - (self._inflated_height / 2 - self._inflate))
         
         # Point must be within the rounded corner radius
-        return math.sqrt(dx * dx + dy * dy) <= self._inflate
+        return dx * dx + dy * dy <= self._inflate * self._inflate
         
     def contains_shape(self, other: 'Shape') -> bool:
         """Check if this rectangle fully contains another shape."""
-        from dungeongen.graphics.shapes import Circle
-        
         if isinstance(other, Rectangle):
             return rect_rect_contains(self, other)
         elif isinstance(other, Circle):
@@ -454,6 +545,7 @@ class Rectangle(Shape):
         self.y += dy
         self._inflated_x += dx
         self._inflated_y += dy
+        self._cached_path = None
         return self
     
     def make_translated(self, dx: float, dy: float) -> 'Rectangle':
@@ -638,7 +730,6 @@ class Rectangle(Shape):
         Returns:
             A new Rectangle centered at origin with given grid dimensions
         """
-        from dungeongen.constants import CELL_SIZE
         width = grid_width * CELL_SIZE
         height = grid_height * CELL_SIZE
         return cls(-width/2, -height/2, width, height)
@@ -680,7 +771,12 @@ class Circle(Shape):
         return self._inflate
 
     def contains(self, px: float, py: float) -> bool:
-        return math.sqrt((px - self.cx)**2 + (py - self.cy)**2) <= self._inflated_radius
+        # Squaring would turn a circle deflated below zero into a real one
+        if self._inflated_radius < 0:
+            return False
+        dx = px - self.cx
+        dy = py - self.cy
+        return dx * dx + dy * dy <= self._inflated_radius * self._inflated_radius
         
     def contains_shape(self, other: 'Shape') -> bool:
         """Check if this circle fully contains another shape."""
@@ -728,6 +824,7 @@ class Circle(Shape):
         self.cx += dx
         self.cy += dy
         self._bounds_dirty = True
+        self._cached_path = None
         return self
     
     def make_translated(self, dx: float, dy: float) -> 'Circle':
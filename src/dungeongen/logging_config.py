@@ -64,6 +64,10 @@ class DungeonLogger:
         """Disable specific logging tags."""
         self.enabled_tags.difference_update(tags)
     
+    def is_enabled(self, tag: LogTags) -> bool:
+        """Check if a logging tag is enabled, to skip building costly messages."""
+        return tag in self.enabled_tags
+    
     def log(self, tag: LogTags, message: str, *args, **kwargs) -> None:
         """Log a message if its tag is enabled."""
         if tag in self.enabled_tags:
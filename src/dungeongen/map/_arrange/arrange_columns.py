@@ -7,6 +7,7 @@ from dungeongen.graphics.shapes import Rectangle, Circle
 from typing import List
 from dungeongen.constants import CELL_SIZE
 import math
+import numpy as np
 
 class ColumnArrangement(Enum):
     """Available patterns for arranging columns in rooms."""
@@ -46,14 +47,13 @@ def arrange_columns(room: Room,
         radius = circle.radius - ((margin + 1) * CELL_SIZE)
         center = circle.bounds.center
         
-        # Use 8 columns for now
+        # Use 8 columns for now, evenly spaced around the circle
         num_columns = 8
-        for i in range(num_columns):
-            angle = (i * 2 * math.pi / num_columns)
-            x = center[0] + radius * math.cos(angle)
-            y = center[1] + radius * math.sin(angle)
-            positions.append((x, y))
-            angles.append(angle)
+        circle_angles = np.arange(num_columns) * 2 * math.pi / num_columns
+        xs = center[0] + radius * np.cos(circle_angles)
+        ys = center[1] + radius * np.sin(circle_angles)
+        positions.extend(zip(xs.tolist(), ys.tolist()))
+        angles = circle_angles.tolist()
             
     # For rectangular rooms
     elif isinstance(room._shape, Rectangle):
@@ -69,60 +69,73 @@ def arrange_columns(room: Room,
         top = 1 + margin
         bottom = grid_height - (1 + margin)
         
-        # Calculate all positions in grid coordinates first
-        grid_positions = []  # List of (x,y) grid coordinates
+        # Whole grid cells of the placement rectangle, converted once
+        cell_left, cell_right = int(left), int(right)
+        cell_top, cell_bottom = int(top), int(bottom)
+        
+        # Room too small for the margin: with no whole cells along an axis the
+        # grid and row arrangements have no positions. The perimeter is not
+        # skipped, as its sides still get columns in that case.
+        if ((cell_right < cell_left or cell_bottom < cell_top) and
+                arrangement != ColumnArrangement.RECTANGLE):
+            return []
+        origin_x, origin_y = rect.left, rect.top
+        
+        # Calculate all positions in grid coordinates first, as parallel x and y cell lists
+        cell_xs: List[int] = []  # Grid x of each column
+        cell_ys: List[int] = []  # Grid y of each column
         
         if arrangement == ColumnArrangement.GRID:
-            # Place columns in a grid pattern with 2-unit spacing
-            for x in range(int(left), int(right) + 1):
-                for y in range(int(top), int(bottom) + 1):
-                    grid_positions.append((x, y))
+            # Place columns in a grid pattern, generated column by column
+            grid_x, grid_y = np.meshgrid(np.arange(cell_left, cell_right + 1),
+                                         np.arange(cell_top, cell_bottom + 1),
+                                         indexing='ij')
+            cell_xs = grid_x.ravel().tolist()
+            cell_ys = grid_y.ravel().tolist()
                         
         elif arrangement == ColumnArrangement.RECTANGLE:
             # Place columns around perimeter
             # Top and bottom rows
-            for x in range(int(left), int(right) + 1):
-                grid_positions.append((x, int(top)))  # Top row
-                grid_positions.append((x, int(bottom)))  # Bottom row
+            for x in range(cell_left, cell_right + 1):
+                cell_xs += (x, x)
+                cell_ys += (cell_top, cell_bottom)  # Top row, bottom row
             
             # Left and right columns (excluding corners)
-            for y in range(int(top) + 1, int(bottom)):
-                grid_positions.append((int(left), y))  # Left column
-                grid_positions.append((int(right), y))  # Right column
+            for y in range(cell_top + 1, cell_bottom):
+                cell_xs += (cell_left, cell_right)  # Left column, right column
+                cell_ys += (y, y)
                         
         elif arrangement == ColumnArrangement.HORIZONTAL_ROWS:
             if bottom - top < 2:  # Not enough vertical space for two rows
                 return []
             # Place columns in two horizontal rows
-            for x in range(int(left), int(right) + 1):
-                grid_positions.append((x, int(top)))      # Top row
-                grid_positions.append((x, int(bottom)))   # Bottom row
+            for x in range(cell_left, cell_right + 1):
+                cell_xs += (x, x)
+                cell_ys += (cell_top, cell_bottom)  # Top row, bottom row
                 
         else:  # VERTICAL_ROWS
             if right - left < 2:  # Not enough horizontal space for two columns
                 return []
             # Place columns in two vertical rows
-            for y in range(int(top), int(bottom) + 1):
-                grid_positions.append((int(left), y))     # Left column
-                grid_positions.append((int(right), y))    # Right column
+            for y in range(cell_top, cell_bottom + 1):
+                cell_xs += (cell_left, cell_right)  # Left column, right column
+                cell_ys += (y, y)
 
-        # Convert grid positions to map space
-        for grid_x, grid_y in grid_positions:
-            map_x = rect.left + (grid_x * CELL_SIZE)
-            map_y = rect.top + (grid_y * CELL_SIZE)
-            positions.append((map_x, map_y))
+        # Convert grid positions to map space in one vectorized pass
+        map_xs = origin_x + np.asarray(cell_xs) * CELL_SIZE
+        map_ys = origin_y + np.asarray(cell_ys) * CELL_SIZE
+        positions.extend(zip(map_xs.tolist(), map_ys.tolist()))
     
     else:
         raise ValueError(f"Unsupported room shape for column arrangement: {type(room._shape)}")
         
-    # Create and add columns
-    columns = []
-    for i, pos in enumerate(positions):
-        angle = angles[i] if angles else 0
-        column = (Column.create_square(pos[0], pos[1], angle + math.pi/2) 
-                    if column_type == ColumnType.SQUARE 
-                    else Column.create_round(pos[0], pos[1]))
-        room.add_prop(column)
-        columns.append(column)
+    # Create columns and add them to the room in one batch
+    if column_type == ColumnType.SQUARE:
+        if not angles:
+            angles = [0] * len(positions)
+        columns = Column.create_squares(positions, [angle + math.pi/2 for angle in angles])
+    else:
+        columns = Column.create_rounds(positions)
+    room.add_props(columns)
         
     return columns
\ No newline at end of file
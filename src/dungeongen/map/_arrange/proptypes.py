@@ -1,13 +1,14 @@
 """Prop type definitions."""
 
+import random
 from enum import StrEnum, auto
-from typing import TYPE_CHECKING, Type
+from typing import TYPE_CHECKING, Optional, Type
 
 from dungeongen.graphics.rotation import Rotation
+from dungeongen.map._props.rock import Rock
 
 if TYPE_CHECKING:
     from dungeongen.map._props.prop import Prop # type: ignore
-    from dungeongen.map._props.rock import Rock # type: ignore
 
 class PropType(StrEnum):
     """Available prop types that can be added to map elements."""
@@ -29,11 +30,12 @@ class PropType(StrEnum):
         """Get all rock prop types."""
         return [cls.SMALL_ROCK, cls.MEDIUM_ROCK, cls.LARGE_ROCK]
         
-    def create_prop(self, rotation: Rotation = Rotation.ROT_0) -> 'Prop':
+    def create_prop(self, rotation: Rotation = Rotation.ROT_0, rng: Optional[random.Random] = None) -> 'Prop':
         """Create a new prop instance of this type.
         
         Args:
             rotation: Optional rotation for the prop
+            rng: Random generator for the prop's variations (defaults to the global one)
             
         Returns:
             New prop instance
@@ -42,10 +44,10 @@ class PropType(StrEnum):
             ValueError: If prop type is not supported
         """
         if self == PropType.SMALL_ROCK:
-            return Rock.create_small()
+            return Rock.create_small(rng)
         elif self == PropType.MEDIUM_ROCK:
-            return Rock.create_medium()
+            return Rock.create_medium(rng)
         elif self == PropType.LARGE_ROCK:
-            return Rock.create_large()
+            return Rock.create_large(rng)
         else:
             raise ValueError(f"Unsupported prop type: {self}")
@@ -2,7 +2,7 @@
 
 import math
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, List
 import skia
 
 from dungeongen.graphics.shapes import Circle, Rectangle, Shape
@@ -32,6 +32,8 @@ SQUARE_COLUMN_TYPE = PropType(
 class Column(Prop):
     """A column prop that can be either round or square."""
     
+    __slots__ = ('_column_type',)
+    
     def __init__(self, position: Point, column_type: ColumnType = ColumnType.ROUND, rotation: Rotation = Rotation.ROT_0) -> None:
         """Initialize a column prop.
         
@@ -100,3 +102,14 @@ class Column(Prop):
     def create_square(cls, x: float, y: float, angle: float = 0) -> 'Column':
         """Create a square column prop at origin."""
         return cls((x, y), ColumnType.SQUARE, rotation=Rotation.from_radians(angle))
+
+    @classmethod
+    def create_rounds(cls, positions: Iterable[Point]) -> List['Column']:
+        """Create a round column prop at each of the given positions."""
+        return [cls(position, ColumnType.ROUND) for position in positions]
+
+    @classmethod
+    def create_squares(cls, positions: Iterable[Point], angles: Iterable[float]) -> List['Column']:
+        """Create a square column prop at each position, rotated by the matching angle."""
+        return [cls(position, ColumnType.SQUARE, rotation=Rotation.from_radians(angle))
+                for position, angle in zip(positions, angles)]
@@ -2,18 +2,21 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-import math
 import random
-from typing import TYPE_CHECKING, Optional, ClassVar, Union, Protocol
+from typing import TYPE_CHECKING, Optional, ClassVar, Sequence, Union, Protocol
 
 import skia
 
 from dungeongen.debug_config import debug_draw, DebugDrawFlags
+from dungeongen.logging_config import logger, LogTags
 from dungeongen.options import Options
 
 # Maximum attempts to find valid random position
 MAX_PLACEMENT_ATTEMPTS = 30
 
+# Bound once; random.uniform adds a Python frame per call in hot loops
+_rand = random.random
+
 from dungeongen.graphics.shapes import Rectangle, Shape
 from dungeongen.graphics.aliases import Point
 from dungeongen.constants import CELL_SIZE
@@ -42,6 +45,9 @@ class Prop(ABC):
     drawing logic.
     """
     
+    __slots__ = ('_prop_type', '_boundary_shape', '_bounds', '_grid_size', '_grid_bounds',
+                 '_rotation', '_map', '_container', '_options', '_draw_matrix')
+    
     def __init__(self, 
                  prop_type: PropType,                    
                  position: Point,
@@ -104,6 +110,8 @@ class Prop(ABC):
         self._map: 'Map' = None #type: ignore
         self._container: 'MapElement' = None #type: ignore
         self._options: Optional[Options] = None
+        # Transform to the prop's local drawing frame, built on first draw
+        self._draw_matrix: Optional[skia.Matrix] = None
     
     @property
     def prop_type(self) -> PropType:
@@ -178,18 +186,40 @@ class Prop(ABC):
         """
         pass
 
+    @classmethod
+    def draw_batch(cls, canvas: skia.Canvas, props: Sequence['Prop'], layer: Layers = Layers.PROPS) -> None:
+        """Draw a group of props of this class.
+        
+        The base implementation draws each prop individually. Subclasses whose
+        props share the same paints can override this to set up that shared
+        state once for the whole group. Props must still be drawn in order.
+        
+        Args:
+            canvas: The canvas to draw on
+            props: Props of this class to draw
+            layer: The current drawing layer
+        """
+        for prop in props:
+            prop.draw(canvas, layer)
+
     def draw(self, canvas: skia.Canvas, layer: Layers = Layers.PROPS) -> None:
         """Draw the prop with proper coordinate transformation and styling."""
         # Save canvas state
         save_count = canvas.save()
         
-        # Move to prop center
+        # Move to prop center and apply rotation in a single cached transform
         draw_bounds = self._grid_bounds if self._grid_bounds is not None else self._bounds
-        center = draw_bounds.center
-        canvas.translate(center[0], center[1])
-        
-        # Apply rotation (skia uses clockwise degrees, we use counterclockwise radians)
-        canvas.rotate(self.rotation.radians * (180 / math.pi))
+        matrix = self._draw_matrix
+        if matrix is None:
+            center = draw_bounds.center
+            matrix = skia.Matrix.Translate(center[0], center[1])
+            # Skia uses clockwise degrees, we use counterclockwise radians;
+            # Rotation already stores its degrees, and unrotated props need no rotation
+            degrees = self._rotation.degrees
+            if degrees:
+                matrix.preRotate(degrees)
+            self._draw_matrix = matrix
+        canvas.concat(matrix)
         
         # Draw additional content in local coordinates centered at 0,0
         self._draw_content(canvas, Rectangle(-draw_bounds.width/2, -draw_bounds.height/2, draw_bounds.width, draw_bounds.height), layer)
@@ -233,6 +263,10 @@ class Prop(ABC):
         # Update grid bounds if set
         if self._grid_bounds is not None:
             self._grid_bounds.translate(dx, dy)
+        self._draw_matrix = None
+        # Container's recorded props picture no longer matches
+        if self._container is not None:
+            self._container.invalidate_props_picture()
 
     def snap_valid_position(self, x: float, y: float) -> Point | None:
         """Snap a position to the nearest valid position for this prop.
@@ -324,11 +358,13 @@ class Prop(ABC):
             
         return None
 
-    def place_random_position(self, max_attempts: int = MAX_PLACEMENT_ATTEMPTS) -> Point | None:
+    def place_random_position(self, max_attempts: int = MAX_PLACEMENT_ATTEMPTS,
+                              rng: Optional[random.Random] = None) -> Point | None:
         """Try to place this prop at a valid random position within its container.
         
         Args:
             max_attempts: Maximum number of random positions to try
+            rng: Random generator to draw positions from (defaults to the global one)
             
         Returns:
             Tuple of (x,y) coordinates if valid position found, None if all attempts failed
@@ -340,12 +376,21 @@ class Prop(ABC):
             
         # Get container bounds
         bounds = self.container.bounds
+        min_x, min_y = bounds.x, bounds.y
+        width, height = bounds.width, bounds.height
+        
+        # No position can be found in an empty container, so skip the attempts
+        if width <= 0 or height <= 0:
+            logger.debug(LogTags.DECORATION, "No room to place %s in empty container", type(self).__name__)
+            return None
+        self.container.shape.accelerate()
+        rand = rng.random if rng is not None else _rand
         
         # Try random positions
         for _ in range(max_attempts):
             # Generate random position within bounds
-            x = random.uniform(bounds.x, bounds.x + bounds.width)
-            y = random.uniform(bounds.y, bounds.y + bounds.height)
+            x = min_x + width * rand()
+            y = min_y + height * rand()
             
             # For grid-aligned props, snap to grid first
             if self.prop_type.is_grid_aligned:
@@ -426,15 +471,6 @@ class Prop(ABC):
             if (x % CELL_SIZE != 0) or (y % CELL_SIZE != 0):
                 return False
         
-        pos = self.position
-        shape: Shape
-        if (x == pos[0]) and (y == pos[1]):
-            shape = self._boundary_shape
-        else:
-            dx = x - pos[0]  # Fixed: Corrected direction of translation
-            dy = y - pos[1]
-            shape = self._boundary_shape.make_translated(dx, dy)
-
         # Check if shape is contained within container
         container = container or self.container
         if not container.contains_point(x, y):
@@ -442,6 +478,15 @@ class Prop(ABC):
             
         # For non-decorative props, check intersection with other props
         if not self.prop_type.is_decoration:
+            pos = self.position
+            shape: Shape
+            if (x == pos[0]) and (y == pos[1]):
+                shape = self._boundary_shape
+            else:
+                dx = x - pos[0]  # Fixed: Corrected direction of translation
+                dy = y - pos[1]
+                shape = self._boundary_shape.make_translated(dx, dy)
+            
             for prop in self.container._props:
                 if prop is not self and \
                     not prop.prop_type.is_decoration and \
@@ -1,7 +1,7 @@
 import math
 import random
 import skia
-from typing import List, TYPE_CHECKING
+from typing import Callable, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from dungeongen.graphics.shapes import Circle, Rectangle, Shape
 from dungeongen.graphics.aliases import Point
@@ -22,16 +22,22 @@ MEDIUM_ROCK_MAX_SIZE = 1/6
 
 ROCK_PROP_TYPE = PropType(is_decoration=True)
 
+# Number of perturbed points around the rock outline
+ROCK_CONTROL_POINTS = 8
+
+# Bound once; random.uniform adds a Python frame per call in hot loops
+_rand = random.random
+
 class Rock(Prop):
     """A rock prop with irregular circular shape."""
     
-    def __init__(self, center: Point, radius: float) -> None:
+    def __init__(self, center: Point, radius: float, rng: Optional[random.Random] = None) -> None:
         """Initialize a rock with position and size.
         
         Args:
             center: Center position in map coordinates (center_x, center_y)
             radius: Final rock radius in drawing units (including any size variations)
-            rotation: Rotation angle (affects perturbation)
+            rng: Random generator for the outline (defaults to the global one)
         """
         # Store rock-specific properties first
         self._radius = radius
@@ -43,94 +49,120 @@ class Rock(Prop):
         super().__init__(ROCK_PROP_TYPE, center, boundary_shape=boundary)
         
         # Generate perturbed control points in local coordinates
-        self._control_points = self._generate_control_points()
+        self._control_xs, self._control_ys = self._generate_control_points(
+            rng.random if rng is not None else _rand)
+        
+        # Outline path in local coordinates, built on first draw
+        self._path: skia.Path | None = None
     
-    def _generate_control_points(self) -> List[Point]:
-        """Generate slightly perturbed control points for the rock shape in local coordinates."""
-        points = []
+    def _generate_control_points(self, rand: Callable[[], float]) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        """Generate slightly perturbed control points for the rock shape in local coordinates.
+        
+        Args:
+            rand: Function returning uniform random floats in [0, 1)
+            
+        Returns:
+            Parallel tuples of control point x and y coordinates
+        """
+        xs = []
+        ys = []
         
         # Generate points around the circle with small random variations
-        for i in range(8):  # Use 8 points for a smoother shape
-            angle = (i * 2 * math.pi / 8)
+        for i in range(ROCK_CONTROL_POINTS):
+            angle = i * 2 * math.pi / ROCK_CONTROL_POINTS
             
             # Add random variation to radius (±40%)
-            radius_variation = random.uniform(-0.4, 0.4)
-            perturbed_radius = self._radius * (1 + radius_variation)
+            perturbed_radius = self._radius * (1 + (-0.4 + 0.8 * rand()))
             
-            # Add some angular variation (±15 degrees)
-            angle_variation = random.uniform(-0.26, 0.26)  # ±15 degrees in radians
-            perturbed_angle = angle + angle_variation
+            # Add some angular variation (±15 degrees in radians)
+            perturbed_angle = angle + (-0.26 + 0.52 * rand())
             
             # Calculate point position in local coordinates (centered at 0,0)
-            x = perturbed_radius * math.cos(perturbed_angle)
-            y = perturbed_radius * math.sin(perturbed_angle)
+            xs.append(perturbed_radius * math.cos(perturbed_angle))
+            ys.append(perturbed_radius * math.sin(perturbed_angle))
             
-            points.append((x, y))
-            
-        return points
+        return tuple(xs), tuple(ys)
+        
+    @property
+    def path(self) -> skia.Path:
+        """Get the rock outline in local coordinates (centered at 0,0).
+        
+        The control points never change after construction, so the path is
+        built once and reused for every draw.
+        """
+        if self._path is None:
+            self._path = self._build_path()
+        return self._path
+
+    def _build_path(self) -> skia.Path:
+        """Build the closed rock outline from the control points."""
+        path = skia.Path()
+        xs = self._control_xs
+        ys = self._control_ys
+        
+        # Midpoints between each control point and the next, wrapping around
+        mid_xs = [(a + b) * 0.5 for a, b in zip(xs, xs[1:] + xs[:1])]
+        mid_ys = [(a + b) * 0.5 for a, b in zip(ys, ys[1:] + ys[:1])]
+        num_points = len(xs)
         
+        # Start at the first midpoint, then curve through each control point
+        # to the midpoint that follows it
+        path.moveTo(mid_xs[0], mid_ys[0])
+        for i in range(1, num_points + 1):
+            curr_idx = i % num_points
+            path.quadTo(xs[curr_idx], ys[curr_idx], mid_xs[curr_idx], mid_ys[curr_idx])
+        return path
+
     def _draw_content(self, canvas: skia.Canvas, bounds: Rectangle, layer: Layers = Layers.PROPS) -> None:
         """Draw the rock using a perturbed circular path on the specified layer."""
         if layer != Layers.PROPS:
             return
             
-        # Create the rock path
-        path = skia.Path()
+        # Draw fill first, then stroke on top
+        canvas.drawPath(self.path, self._map.prop_fill_paint)
+        canvas.drawPath(self.path, self._map.prop_stroke_paint)
+
+    @classmethod
+    def draw_batch(cls, canvas: skia.Canvas, props: Sequence[Prop], layer: Layers = Layers.PROPS) -> None:
+        """Draw a run of rocks with the map's shared prop paints.
         
-        # Move to first point
-        path.moveTo(self._control_points[0][0], self._control_points[0][1])
+        Rocks are never rotated, so each outline is drawn offset to the rock's
+        center without the per-prop transform setup of draw(). Each rock is
+        filled and stroked before the next, so overlapping rocks cover the
+        ones drawn before them.
+        """
+        if layer != Layers.PROPS or not props:
+            return
         
-        # Add curved segments between points, including back to start
-        num_points = len(self._control_points)
-        for i in range(num_points + 1):
-            curr_idx = i % num_points
-            next_idx = (i + 1) % num_points
-            curr_point = self._control_points[curr_idx]
-            next_point = self._control_points[next_idx]
-            
-            # Use quadratic curve between points
-            mid_x = (curr_point[0] + next_point[0]) / 2
-            mid_y = (curr_point[1] + next_point[1]) / 2
-            
-            if i == 0:
-                # First point - move to midpoint
-                path.moveTo(mid_x, mid_y)
-            else:
-                # Subsequent points - curve through control point to next midpoint
-                path.quadTo(curr_point[0], curr_point[1], mid_x, mid_y)
-
-        # Draw fill first
-        fill_paint = skia.Paint(
-            AntiAlias=True,
-            Style=skia.Paint.kFill_Style,
-            Color=self._map.options.prop_fill_color
-        )
-        canvas.drawPath(path, fill_paint)
-        
-        # Draw stroke on top
-        stroke_paint = skia.Paint(
-            AntiAlias=True,
-            Style=skia.Paint.kStroke_Style,
-            StrokeWidth=self._map.options.prop_stroke_width,
-            Color=self._map.options.prop_outline_color,
-            StrokeJoin=skia.Paint.kRound_Join
-        )
-        canvas.drawPath(path, stroke_paint)
+        dungeon_map = props[0].map
+        fill_paint = dungeon_map.prop_fill_paint
+        stroke_paint = dungeon_map.prop_stroke_paint
+        for rock in props:
+            center = rock.center
+            canvas.save()
+            canvas.translate(center[0], center[1])
+            canvas.drawPath(rock.path, fill_paint) #type: ignore
+            canvas.drawPath(rock.path, stroke_paint) #type: ignore
+            canvas.restore()
+        
+    @classmethod
+    def _create_sized(cls, min_size: float, max_size: float, rng: Optional[random.Random] = None) -> 'Rock':
+        """Create a rock with a random radius between two cell fractions."""
+        uniform = rng.uniform if rng is not None else random.uniform
+        radius = uniform(min_size, max_size) * CELL_SIZE
+        return cls((0, 0), radius, rng)
         
     @classmethod
-    def create_small(cls) -> 'Rock':
+    def create_small(cls, rng: Optional[random.Random] = None) -> 'Rock':
         """Create a small rock."""
-        radius = random.uniform(SMALL_ROCK_MIN_SIZE, SMALL_ROCK_MAX_SIZE) * CELL_SIZE
-        return cls((0, 0), radius)
+        return cls._create_sized(SMALL_ROCK_MIN_SIZE, SMALL_ROCK_MAX_SIZE, rng)
         
     @classmethod
-    def create_medium(cls) -> 'Rock':
+    def create_medium(cls, rng: Optional[random.Random] = None) -> 'Rock':
         """Create a medium rock."""
-        radius = random.uniform(MEDIUM_ROCK_MIN_SIZE, MEDIUM_ROCK_MAX_SIZE) * CELL_SIZE
-        return cls((0, 0), radius)
+        return cls._create_sized(MEDIUM_ROCK_MIN_SIZE, MEDIUM_ROCK_MAX_SIZE, rng)
         
     @classmethod
-    def create_large(cls) -> 'Rock':
+    def create_large(cls, rng: Optional[random.Random] = None) -> 'Rock':
         """Create a large rock."""
-        radius = random.uniform(MEDIUM_ROCK_MAX_SIZE, MEDIUM_ROCK_MAX_SIZE * 1.5) * CELL_SIZE
-        return cls((0, 0), radius)
+        return cls._create_sized(MEDIUM_ROCK_MAX_SIZE, MEDIUM_ROCK_MAX_SIZE * 1.5, rng)
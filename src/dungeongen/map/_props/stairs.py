@@ -17,6 +17,38 @@ STAIRS_PROP_TYPE = PropType(
     boundary_shape=Rectangle(-CELL_SIZE/2, -CELL_SIZE/2, CELL_SIZE, CELL_SIZE)
 )
 
+def _step_lines() -> tuple[tuple[float, float], ...]:
+    """Compute the (y, half width) of each step line relative to the cell center."""
+    # 6 steps, decreasing in length from top (longest) to bottom (shortest)
+    # First line is ON the grid boundary (top edge), others flow down from there
+    num_steps = 6
+    step_spacing = CELL_SIZE / (num_steps - 1)  # Distribute across full cell height
+    
+    # Line widths: top line at full passage width, bottom is narrow
+    max_width = 1.0   # Full cell width for top line
+    min_width = 0.15  # Narrow for bottom line
+    
+    # Small extension past cell edges to cover grid dots on widest line
+    edge_extension = CELL_SIZE * 0.03
+    
+    lines = []
+    for i in range(num_steps):
+        # Y position: first line at top edge (-CELL_SIZE/2), last at bottom edge (+CELL_SIZE/2)
+        y = -CELL_SIZE/2 + step_spacing * i
+        
+        # Width decreases from top to bottom (perspective effect)
+        t = i / (num_steps - 1)  # 0 at top, 1 at bottom
+        width_ratio = max_width - t * (max_width - min_width)
+        # Only add edge extension to the widest lines
+        extension = edge_extension * (1 - t) if t < 0.5 else 0
+        lines.append((y, (CELL_SIZE * width_ratio) / 2 + extension))
+    return tuple(lines)
+
+# Step geometry never changes, so it is computed once at import
+_STEP_LINES = _step_lines()
+# Step line end points, in pairs, for drawing all steps at once
+_STEP_POINTS = [skia.Point(x, y) for y, half_width in _STEP_LINES for x in (-half_width, half_width)]
+
 class StairsProp(Prop):
     """A staircase prop drawn as horizontal lines showing steps.
     
@@ -24,6 +56,8 @@ class StairsProp(Prop):
     without affecting the background or borders.
     """
     
+    __slots__ = ()
+    
     def __init__(self, position: Point, rotation: Rotation = Rotation.ROT_0) -> None:
         """Initialize stairs prop.
         
@@ -39,38 +73,11 @@ class StairsProp(Prop):
             return
         
         # Draw step lines in solid black with border width
-        step_paint = skia.Paint(
-            AntiAlias=True,
-            Style=skia.Paint.kStroke_Style,
-            StrokeWidth=self._map.options.border_width * 0.5,
-            Color=skia.Color(0, 0, 0)  # Solid black
-        )
-        
-        # 6 steps, decreasing in length from top (longest) to bottom (shortest)
-        # First line is ON the grid boundary (top edge), others flow down from there
-        num_steps = 6
-        step_spacing = CELL_SIZE / (num_steps - 1)  # Distribute across full cell height
-        
-        # Line widths: top line at full passage width, bottom is narrow
-        max_width = 1.0   # Full cell width for top line
-        min_width = 0.15  # Narrow for bottom line
+        step_paint = self._map.step_paint
         
-        # Small extension past cell edges to cover grid dots on widest line
-        edge_extension = CELL_SIZE * 0.03
-        
-        # Draw relative to center (0,0) since canvas is already translated
-        for i in range(num_steps):
-            # Y position: first line at top edge (-CELL_SIZE/2), last at bottom edge (+CELL_SIZE/2)
-            y = -CELL_SIZE/2 + step_spacing * i
-            
-            # Width decreases from top to bottom (perspective effect)
-            t = i / (num_steps - 1)  # 0 at top, 1 at bottom
-            width_ratio = max_width - t * (max_width - min_width)
-            # Only add edge extension to the widest lines
-            extension = edge_extension * (1 - t) if t < 0.5 else 0
-            half_width = (CELL_SIZE * width_ratio) / 2 + extension
-            
-            canvas.drawLine(-half_width, y, half_width, y, step_paint)
+        # Draw relative to center (0,0) since canvas is already translated,
+        # all steps in a single call
+        canvas.drawPoints(skia.Canvas.kLines_PointMode, _STEP_POINTS, step_paint)
     
     @classmethod
     def at_grid(cls, grid_x: int, grid_y: int, rotation: Rotation = Rotation.ROT_0) -> 'StairsProp':
@@ -43,6 +43,8 @@ class Door(MapElement):
     When open, it forms an I-shaped passage connecting the sides.
     """
     
+    accepts_decorations = False
+    
     def __init__(self, x: float, y: float, orientation: DoorOrientation, door_type: DoorType = DoorType.OPEN) -> None:
         """Initialize a door with position and orientation.
         
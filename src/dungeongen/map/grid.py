@@ -17,7 +17,7 @@ def draw_region_grid(canvas: skia.Canvas, region: Region, options: 'Options') ->
         region: The region to draw grid for
         options: Drawing configuration options
     """
-    bounds = region.shape.bounds
+    bounds = region.bounds
     
     # Calculate grid-aligned bounds, ensuring we start before the shape bounds
     min_x = math.floor(bounds.x / CELL_SIZE)
@@ -47,7 +47,7 @@ def draw_region_grid(canvas: skia.Canvas, region: Region, options: 'Options') ->
         # Draw for bounds width plus two dot spacings
         while x <= bounds.x + bounds.width + 2 * dot_spacing:
             x += dot_spacing
-            if region.shape.contains(x, py):
+            if region.contains(x, py):
                 # Apply length variation as a percentage of base length
                 dot_length = options.grid_dot_length * (1 + random.uniform(
                     -options.grid_dot_variation,
@@ -72,7 +72,7 @@ def draw_region_grid(canvas: skia.Canvas, region: Region, options: 'Options') ->
         # Draw for bounds height plus two dot spacings
         while y <= bounds.y + bounds.height + 2 * dot_spacing:
             y += dot_spacing
-            if region.shape.contains(px, y):
+            if region.contains(px, y):
                 # Apply length variation as a percentage of base length
                 dot_length = options.grid_dot_length * (1 + random.uniform(
                     -options.grid_dot_variation,
@@ -16,7 +16,6 @@ from dungeongen.drawing.crosshatch import draw_crosshatches
 from dungeongen.drawing.crosshatch_tiled import draw_crosshatches_tiled, generate_hatch_tile, HatchTileData
 from dungeongen.drawing.water import WaterStyle
 from dungeongen.map.enums import Layers
-from typing import Generic, Iterator, List, Optional, Sequence, Tuple, TypeVar, TYPE_CHECKING
 from dungeongen.map.grid import GridStyle, draw_region_grid
 from dungeongen.map.mapelement import MapElement
 from dungeongen.map.occupancy import ElementType, OccupancyGrid
@@ -50,6 +49,11 @@ class Map:
         self._hatch_tile: Optional[HatchTileData] = None  # Cached crosshatch tile
         self._water_layer: Optional[WaterLayer] = None  # Water generation layer
         self._water_depth: float = WaterDepth.DRY  # Water depth level (0 = disabled)
+        self._prop_fill_paint: Optional[skia.Paint] = None  # Cached prop fill paint
+        self._prop_stroke_paint: Optional[skia.Paint] = None  # Cached prop outline paint
+        self._step_paint: Optional[skia.Paint] = None  # Cached stair step paint
+        self._corner_paint: Optional[skia.Paint] = None  # Cached room corner paint
+        self._paints_revision: int = -1  # Options revision the cached paints were built at
     
     @staticmethod
     def get_invalid_map() -> 'Map':
@@ -71,6 +75,66 @@ class Map:
             self._hatch_tile = generate_hatch_tile(self._options, grid_cells=4, seed=4242)
         return self._hatch_tile
     
+    def _check_paints(self) -> None:
+        """Drop the cached paints if the options have changed since they were built."""
+        if self._paints_revision != self._options.revision:
+            self._prop_fill_paint = None
+            self._prop_stroke_paint = None
+            self._step_paint = None
+            self._corner_paint = None
+            self._paints_revision = self._options.revision
+
+    @property
+    def prop_fill_paint(self) -> skia.Paint:
+        """Get the cached fill paint for prop outlines."""
+        self._check_paints()
+        if self._prop_fill_paint is None:
+            self._prop_fill_paint = skia.Paint(
+                AntiAlias=True,
+                Style=skia.Paint.kFill_Style,
+                Color=self._options.prop_fill_color
+            )
+        return self._prop_fill_paint
+    
+    @property
+    def prop_stroke_paint(self) -> skia.Paint:
+        """Get the cached stroke paint for prop outlines."""
+        self._check_paints()
+        if self._prop_stroke_paint is None:
+            self._prop_stroke_paint = skia.Paint(
+                AntiAlias=True,
+                Style=skia.Paint.kStroke_Style,
+                StrokeWidth=self._options.prop_stroke_width,
+                Color=self._options.prop_outline_color,
+                StrokeJoin=skia.Paint.kRound_Join
+            )
+        return self._prop_stroke_paint
+    
+    @property
+    def step_paint(self) -> skia.Paint:
+        """Get the cached stroke paint for stair step lines."""
+        self._check_paints()
+        if self._step_paint is None:
+            self._step_paint = skia.Paint(
+                AntiAlias=True,
+                Style=skia.Paint.kStroke_Style,
+                StrokeWidth=self._options.border_width * 0.5,
+                Color=skia.Color(0, 0, 0)  # Solid black
+            )
+        return self._step_paint
+    
+    @property
+    def corner_paint(self) -> skia.Paint:
+        """Get the cached fill paint for room corner decorations."""
+        self._check_paints()
+        if self._corner_paint is None:
+            self._corner_paint = skia.Paint(
+                AntiAlias=self._options.room_corner_antialias,
+                Style=skia.Paint.kFill_Style,
+                Color=0xFF000000  # Black
+            )
+        return self._corner_paint
+    
     def set_water(self, depth: float, seed: int = 42, lf_scale: float = 0.018, resolution_scale: float = 0.2,
                   stroke_width: float = 3.5, ripple_inset: float = 8.0) -> None:
         """Enable water generation with the given depth level.
@@ -383,7 +447,6 @@ class Map:
         """
         if self.is_invalid:
             raise ValueError("Cannot create room in the 'invalid' map")
-        from dungeongen.map.room import Room, RoomType
         return self.add_element(Room.from_grid(grid_x, grid_y, grid_width, grid_height, room_type=RoomType.RECTANGULAR))
     
     def create_circular_room(self, grid_x: float, grid_y: float, grid_diameter: float) -> 'Room':
@@ -399,9 +462,28 @@ class Map:
         """
         if self.is_invalid:
             raise ValueError("Cannot create room in the 'invalid' map")
-        from dungeongen.map.room import Room, RoomType
         return self.add_element(Room.from_grid(grid_x, grid_y, grid_diameter, grid_diameter, room_type=RoomType.CIRCULAR))
     
+    def _draw_room_corners(self, canvas: skia.Canvas, elements: Sequence[MapElement]) -> None:
+        """Fill the corner decorations of all rectangular rooms with a single draw call.
+        
+        Rooms outside the canvas clip are skipped before their corner path is
+        built or merged.
+        
+        Args:
+            canvas: The canvas to draw on
+            elements: Elements to collect room corners from
+        """
+        path = skia.Path()
+        for element in elements:
+            if isinstance(element, Room) and element.has_corners:
+                bounds = element.bounds
+                if canvas.quickReject(skia.Rect.MakeXYWH(bounds.x, bounds.y, bounds.width, bounds.height)):
+                    continue
+                path.addPath(element.corner_path)
+        if not path.isEmpty():
+            canvas.drawPath(path, self.corner_paint)
+
     def recalculate_occupied(self) -> None:
         """Recalculate which grid spaces are occupied by map elements."""
         self.occupancy.clear()
@@ -520,9 +602,14 @@ class Map:
                 
                 canvas.restore()
 
-            # 6. Draw region elements props
+            # 6. Draw room corners in one batch (ahead of all the region's
+            # props), then region elements props without their own corners
+            self._draw_room_corners(canvas, region.elements)
             for element in region.elements:
-                element.draw(canvas, Layers.PROPS)
+                if isinstance(element, Room):
+                    element.draw(canvas, Layers.PROPS, draw_corners=False)
+                else:
+                    element.draw(canvas, Layers.PROPS)
 
             # 7. Restore transform and clear clip mask
             canvas.restore()
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from itertools import groupby
 from typing import List, Optional, TYPE_CHECKING, Sequence, Union
 import random
 import math
@@ -28,6 +29,12 @@ class MapElement:
     - Props (decorations or other elements)
     """
     
+    __slots__ = ('_shape', '_map', '_options', '_bounds', '_connections', '_props',
+                 '_props_picture', '_props_picture_key')
+    
+    # Whether random decoration props (rocks, etc.) may be placed in this element
+    accepts_decorations: bool = True
+    
     def __init__(self, shape: Shape) -> None:
         global _invalid_map, _invalid_options
         if _invalid_map is None:
@@ -42,6 +49,9 @@ class MapElement:
         self._bounds = self._shape.bounds
         self._connections: List['MapElement'] = []
         self._props: List['Prop'] = []
+        # Recorded PROPS layer drawing, replayed until the props change
+        self._props_picture: Optional[skia.Picture] = None
+        self._props_picture_key: Optional[tuple] = None
 
     @staticmethod
     def get_invalid_map_element() -> 'MapElement':
@@ -114,6 +124,29 @@ class MapElement:
         prop._map = self._map
         prop._options = self._options
         self._props.append(prop)
+        self.invalidate_props_picture()
+
+    def add_props(self, props: Sequence['Prop']) -> None:
+        """Add several props to this element at their current positions.
+        
+        Equivalent to calling add_prop for each prop, but the prop list is
+        extended and the props picture invalidated only once.
+        
+        Args:
+            props: The props to add
+        """
+        if self.is_invalid:
+            raise ValueError("Cannot add prop to 'invalid' map element")
+        
+        for prop in props:
+            # Remove from previous container if it has one
+            if prop._container is not None and not prop._container.is_invalid:
+                prop._container.remove_prop(prop)
+            prop._container = self
+            prop._map = self._map
+            prop._options = self._options
+        self._props.extend(props)
+        self.invalidate_props_picture()
 
     def remove_prop(self, prop: 'Prop') -> None:
         """Remove a prop from this element."""
@@ -121,6 +154,7 @@ class MapElement:
             raise ValueError("Cannot remove prop from 'invalid' map element")
         if prop in self._props:
             self._props.remove(prop)
+            self.invalidate_props_picture()
             prop._container = MapElement.get_invalid_map_element()
             # Use the cached global _invalid_map (populated during __init__)
             prop._map = _invalid_map
@@ -189,15 +223,8 @@ class MapElement:
             layer: The current drawing layer
         """
         if layer == Layers.PROPS:
-            # Draw decoration props first
-            for prop in self._props:
-                if prop.prop_type.is_decoration:
-                    prop.draw(canvas, layer)
-                    
-            # Then draw non-decoration props
-            for prop in self._props:
-                if not prop.prop_type.is_decoration:
-                    prop.draw(canvas, layer)
+            if self._props:
+                canvas.drawPicture(self.get_props_picture())
         elif layer == Layers.SHADOW:
             # Only draw shadows for non-decoration props
             for prop in self._props:
@@ -219,6 +246,44 @@ class MapElement:
             for prop in self._props:
                 prop.shape.draw(canvas, debug_paint)
                 
+    def get_props_picture(self) -> skia.Picture:
+        """Get a pre-recorded Skia Picture of this element's PROPS layer.
+        
+        Props are static once placed, so their drawing commands are recorded
+        once, in map units, and replayed on later renders at any scale. The
+        picture is re-recorded after invalidate_props_picture(), after the
+        element's bounds or the map's options revision change, or when prop
+        grid-bounds debug drawing is toggled.
+        """
+        bounds = self._bounds
+        key = (bounds.x, bounds.y, bounds.width, bounds.height,
+               self._map.options.revision, debug_draw.is_enabled(DebugDrawFlags.GRID_BOUNDS))
+        if self._props_picture is None or self._props_picture_key != key:
+            # Cull to our bounds plus a cell of slack for props that overhang
+            recorder = skia.PictureRecorder()
+            canvas = recorder.beginRecording(
+                skia.Rect.MakeXYWH(bounds.x - CELL_SIZE, bounds.y - CELL_SIZE,
+                                   bounds.width + 2 * CELL_SIZE, bounds.height + 2 * CELL_SIZE))
+            
+            # Draw decoration props first, then the rest, each in the order
+            # they were added; consecutive props of one class draw as a batch
+            for is_decoration in (True, False):
+                props = [prop for prop in self._props if prop.prop_type.is_decoration == is_decoration]
+                for prop_cls, run in groupby(props, type):
+                    prop_cls.draw_batch(canvas, list(run), Layers.PROPS)
+            
+            self._props_picture = recorder.finishRecordingAsPicture()
+            self._props_picture_key = key
+        return self._props_picture
+
+    def invalidate_props_picture(self) -> None:
+        """Discard the recorded PROPS picture so the next draw re-records it.
+        
+        Props call this when they move. Call it after any other change to how
+        a prop draws.
+        """
+        self._props_picture = None
+
     def prop_intersects(self, prop: 'Prop') -> list['Prop']:
         """Check if a prop intersects with any non-decoration props in this element.
         
@@ -240,8 +305,22 @@ class MapElement:
         return intersecting
 
     def contains_point(self, x: float, y: float) -> bool:
-        """Check if a point is contained within this element's shape."""
-        return self._shape.contains(x, y)
+        """Check if a point is contained within this element's shape.
+        
+        Points outside the element's bounding box are rejected before the
+        exact (possibly much slower) shape test.
+        """
+        bounds = self._bounds
+        if not (bounds.x <= x <= bounds.x + bounds.width and
+                bounds.y <= y <= bounds.y + bounds.height):
+            return False
+        
+        # The bounds test is already exact for plain rectangles, which are
+        # the most common room shape
+        shape = self._shape
+        if type(shape) is Rectangle and shape.inflate <= 0:
+            return True
+        return shape.contains(x, y)
         
     def contains_rectangle(self, rect: Rectangle, margin: float = 0) -> bool:
         """Check if a rectangle is fully contained within this element's shape.
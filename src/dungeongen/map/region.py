@@ -1,8 +1,8 @@
 """Region class for grouping map elements."""
 
 import skia
-from typing import List, Sequence
-from dungeongen.graphics.shapes import Shape, ShapeGroup
+from typing import List, Optional, Sequence
+from dungeongen.graphics.shapes import Rectangle, Shape, ShapeGroup
 from dungeongen.map.mapelement import MapElement
 
 
@@ -20,6 +20,8 @@ class Region:
     elements themselves.
     """
 
+    __slots__ = ('shape', 'elements', '_bounds', '_accelerated_shape')
+
     def __init__(self, shape: Shape, elements: Sequence[MapElement]) -> None:
         """Initialize a region with its shape and contained elements.
 
@@ -29,6 +31,31 @@ class Region:
         """
         self.shape: Shape = shape
         self.elements: List[MapElement] = list(elements)
+        self._bounds: Rectangle = shape.bounds
+        # Shape whose containment raster has been baked, if any
+        self._accelerated_shape: Optional[Shape] = None
+
+    @property
+    def bounds(self) -> Rectangle:
+        """Get the bounding rectangle of this region's shape.
+        
+        Computed once when the region is created rather than fetched from
+        the shape on every access.
+        """
+        return self._bounds
+
+    def contains(self, px: float, py: float) -> bool:
+        """Check if a point is inside this region.
+        
+        The first query bakes the shape's coarse inside/outside raster, so
+        repeated queries are mostly a single array lookup. Points near the
+        edge still get the exact test.
+        """
+        shape = self.shape
+        if self._accelerated_shape is not shape:
+            shape.accelerate()
+            self._accelerated_shape = shape
+        return shape.contains(px, py)
 
     def inflated(self, amount: float) -> 'Region':
         """Return a new region with its shape inflated by the given amount."""
@@ -2,18 +2,14 @@
 
 from dataclasses import dataclass
 from enum import Enum, auto
-import math
-from typing import List, TYPE_CHECKING, Tuple, Optional
-import random
+from typing import TYPE_CHECKING, Tuple, Optional
 from dungeongen.layout.spatial import Point
 import skia
 from dungeongen.map.occupancy import ElementType
 from dungeongen.logging_config import logger, LogTags
-from dungeongen.logging_config import logger, LogTags
 
-from dungeongen.graphics.math import Point2D
-from dungeongen.graphics.shapes import Rectangle, Circle, Shape
-from dungeongen.graphics.conversions import grid_to_map, map_to_grid_rect
+from dungeongen.graphics.shapes import Rectangle, Circle
+from dungeongen.graphics.conversions import grid_to_map
 from dungeongen.map.enums import Layers, RoomDirection
 from dungeongen.map.mapelement import MapElement
 from dungeongen.constants import CELL_SIZE
@@ -29,14 +25,43 @@ MAX_CORNER_LENGTH = 2.0
 # Control point scale for curve (relative to corner size)
 CURVE_CONTROL_SCALE = 0.8  # Increased from 0.5 for more concavity
 
-from dungeongen.map.mapelement import MapElement
-from dungeongen.graphics.conversions import grid_to_map
-from dungeongen.map.enums import Layers
+# Corner sizes in map units, derived once from the constants above
+_CORNER_BASE_SIZE = CELL_SIZE * CORNER_SIZE
+_CORNER_INSET_SIZE = CELL_SIZE * CORNER_INSET
+_CORNER_LENGTH_RANGE = MAX_CORNER_LENGTH - MIN_CORNER_LENGTH
+
+def _unit_corner_path() -> skia.Path:
+    """Build the corner outline with unit wall lengths, corner at the origin.
+    
+    The horizontal wall runs along +x and the vertical wall along +y, so any
+    corner is this template scaled by its signed wall lengths.
+    """
+    path = skia.Path()
+    path.moveTo(0, 0)
+    path.lineTo(1, 0)
+    # Curve back between the wall ends; control points sit along the walls
+    # at a fraction of their length for a smooth inward curve
+    control = 1 - CURVE_CONTROL_SCALE
+    path.cubicTo(control, 0, 0, control, 0, 1)
+    path.close()
+    return path
+
+_UNIT_CORNER_PATH = _unit_corner_path()
+
+def _corner_jitter(x: float, y: float, salt: int) -> float:
+    """Hash a corner position to a stable pseudo-random value in [0, 1].
+    
+    Corners look the same on every redraw and don't consume the global
+    random state during rendering.
+    """
+    h = (int(x) * 0x9E3779B1 ^ int(y) * 0x85EBCA77 ^ salt * 0xC2B2AE3D) & 0xFFFFFFFF
+    # Mix the high bits down so nearby positions give unrelated values
+    h ^= h >> 15
+    h = (h * 0x2C1B3C6D) & 0xFFFFFFFF
+    h ^= h >> 12
+    return h / 0xFFFFFFFF
 
 if TYPE_CHECKING:
-    from dungeongen.map.map import Map
-    from dungeongen.options import Options
-    from dungeongen.map._props.prop import Prop
     from dungeongen.map.occupancy import OccupancyGrid
 
 class RoomType(Enum):
@@ -59,6 +84,8 @@ class Room(MapElement):
     The room's shape matches its bounds exactly.
     """
     
+    __slots__ = ('_room_type', '_number', '_has_corners', '_corner_path', '_corner_path_bounds')
+    
     def __init__(self, \
                 x: float, \
                 y: float, \
@@ -68,20 +95,30 @@ class Room(MapElement):
                 number: int = 0) -> None:
         self._room_type = room_type
         self._number = number  # Room number for display
+        # Only format debug messages when they will be logged
+        log_generation = logger.is_enabled(LogTags.GENERATION)
         if room_type == RoomType.CIRCULAR:
             if width != height:
                 raise ValueError("Circular rooms must have equal width and height.")
-            logger.debug(LogTags.GENERATION,
-                f"\nCreating circular room:\n"
-                f"  Input dimensions: x={x}, y={y}, width={width}, height={height}")
+            if log_generation:
+                logger.debug(LogTags.GENERATION,
+                    f"\nCreating circular room:\n"
+                    f"  Input dimensions: x={x}, y={y}, width={width}, height={height}")
             shape = Circle(x + width / 2, y + width / 2, width / 2)
-            logger.debug(LogTags.GENERATION,
-                f"  Circle params: center=({x + width/2}, {y + width/2}), radius={width/2}")
+            if log_generation:
+                logger.debug(LogTags.GENERATION,
+                    f"  Circle params: center=({x + width/2}, {y + width/2}), radius={width/2}")
         else:
             shape = Rectangle(x, y, width, height)
         super().__init__(shape)
-        logger.debug(LogTags.GENERATION,
-            f"  Final bounds: x={self.bounds.x}, y={self.bounds.y}, w={self.bounds.width}, h={self.bounds.height}")
+        # Only rectangular rooms get corner decorations; the shape type never changes
+        self._has_corners = isinstance(shape, Rectangle)
+        # Corner decorations, built on first draw for the bounds they were built at
+        self._corner_path: Optional[skia.Path] = None
+        self._corner_path_bounds: Optional[Tuple[float, float, float, float]] = None
+        if log_generation:
+            logger.debug(LogTags.GENERATION,
+                f"  Final bounds: x={self.bounds.x}, y={self.bounds.y}, w={self.bounds.width}, h={self.bounds.height}")
     
     @property
     def room_type(self) -> RoomType:
@@ -98,81 +135,90 @@ class Room(MapElement):
         """Set the room number for display."""
         self._number = value
 
-    def _draw_corner(self, canvas: skia.Canvas, corner: Point2D, left: Point2D, right: Point2D) -> None:
-        """Draw a single corner decoration.
+    @property
+    def has_corners(self) -> bool:
+        """Whether this room gets corner decorations (rectangular rooms only)."""
+        return self._has_corners
+
+    def _add_corner(self, path: skia.Path, cx: float, cy: float, sx: float, sy: float) -> None:
+        """Add a single corner decoration to a path.
+        
+        The corner's two walls are always axis aligned, so they are given
+        as the signs of the horizontal and vertical wall directions.
         
         Args:
-            canvas: The canvas to draw on
-            corner: Corner position
-            left: Direction vector parallel to left wall (from corner's perspective)
-            right: Direction vector parallel to right wall (from corner's perspective)
+            path: The path to add the corner outline to
+            cx: Corner x position
+            cy: Corner y position
+            sx: Direction along the horizontal wall (1 or -1)
+            sy: Direction along the vertical wall (1 or -1)
         """
-        # Calculate base corner size
-        base_size = CELL_SIZE * CORNER_SIZE
+        # Calculate wall lengths with constrained random variation
+        length1 = _CORNER_BASE_SIZE * (MIN_CORNER_LENGTH + _corner_jitter(cx, cy, 0) * _CORNER_LENGTH_RANGE)
+        length2 = _CORNER_BASE_SIZE * (MIN_CORNER_LENGTH + _corner_jitter(cx, cy, 1) * _CORNER_LENGTH_RANGE)
         
-        # Calculate end points with constrained random lengths
-        length1 = base_size * (MIN_CORNER_LENGTH + random.random() * (MAX_CORNER_LENGTH - MIN_CORNER_LENGTH))
-        length2 = base_size * (MIN_CORNER_LENGTH + random.random() * (MAX_CORNER_LENGTH - MIN_CORNER_LENGTH))
-        p1 = corner + left * length1
-        p2 = corner + right * length2
+        # Place the unit corner template, scaled (and flipped) to the walls
+        matrix = skia.Matrix.MakeAll(sx * length1, 0, cx, 0, sy * length2, cy, 0, 0, 1)
+        path.addPath(_UNIT_CORNER_PATH, matrix)
+
+    @property
+    def corner_path(self) -> skia.Path:
+        """Get the outline of all four corner decorations.
         
-        # Create and draw the corner path
+        Corner sizes depend only on the room bounds, so the path is built once
+        and rebuilt only if the bounds change.
+        """
+        bounds = self._bounds
+        key = (bounds.x, bounds.y, bounds.width, bounds.height)
+        if self._corner_path is None or self._corner_path_bounds != key:
+            self._corner_path = self._build_corner_path(*key)
+            self._corner_path_bounds = key
+        return self._corner_path
+
+    def _build_corner_path(self, x: float, y: float, width: float, height: float) -> skia.Path:
+        """Build the outline of all four corner decorations for the given bounds."""
         path = skia.Path()
-        path.moveTo(corner.x, corner.y)
-        path.lineTo(p1.x, p1.y)
         
-        # Draw curved line between points with smooth inward curve
-        # Control points are placed along the straight lines at a fraction of their length
-        cp1 = p1 + (corner - p1) * CURVE_CONTROL_SCALE
-        cp2 = p2 + (corner - p2) * CURVE_CONTROL_SCALE
-        path.cubicTo(cp1.x, cp1.y, cp2.x, cp2.y, p2.x, p2.y)
-        
-        # Close the path
-        path.lineTo(corner.x, corner.y)
+        # Calculate corner positions with inset
+        inset = _CORNER_INSET_SIZE
+        left = x + inset
+        right = x + width - inset
+        top = y + inset
+        bottom = y + height - inset
         
-        # Fill the corner with black
-        corner_paint = skia.Paint(
-            AntiAlias=True,
-            Style=skia.Paint.kFill_Style,
-            Color=0xFF000000  # Black
-        )
-        canvas.drawPath(path, corner_paint)
+        # Add all four corners with the directions of their walls
+        self._add_corner(path, left, top, 1, 1)        # Top-left
+        self._add_corner(path, right, top, -1, 1)      # Top-right
+        self._add_corner(path, left, bottom, 1, -1)    # Bottom-left
+        self._add_corner(path, right, bottom, -1, -1)  # Bottom-right
+        return path
 
     def draw_corners(self, canvas: skia.Canvas) -> None:
         """Draw corner decorations if this is a rectangular self."""
-        if not isinstance(self._shape, Rectangle):
+        if not self._has_corners:
             return
-            
-        # Calculate corner positions with inset
-        inset = CELL_SIZE * CORNER_INSET
-        left = self._bounds.x + inset
-        right = self._bounds.x + self._bounds.width - inset
-        top = self._bounds.y + inset
-        bottom = self._bounds.y + self._bounds.height - inset
-        
-        # Create corner points and wall vectors
-        from dungeongen.graphics.math import Point2D
         
-        # Corner positions
-        tl = Point2D(left, top)
-        tr = Point2D(right, top)
-        bl = Point2D(left, bottom)
-        br = Point2D(right, bottom)
-        
-        # Wall direction vectors
-        right_vec = Point2D(1, 0)
-        down_vec = Point2D(0, 1)
+        # Skip rooms outside the clip before building any corner geometry
+        bounds = self._bounds
+        if canvas.quickReject(skia.Rect.MakeXYWH(bounds.x, bounds.y, bounds.width, bounds.height)):
+            return
         
-        # Draw all four corners with appropriate wall vectors
-        self._draw_corner(canvas, tl, right_vec, down_vec)      # Top-left
-        self._draw_corner(canvas, tr, -right_vec, down_vec)     # Top-right  
-        self._draw_corner(canvas, bl, right_vec, -down_vec)     # Bottom-left
-        self._draw_corner(canvas, br, -right_vec, -down_vec)    # Bottom-right
+        # Fill all corners with black in one call
+        canvas.drawPath(self.corner_path, self._map.corner_paint)
 
-    def draw(self, canvas: 'skia.Canvas', layer: Layers = Layers.PROPS) -> None:
-        """Draw the room and its props."""
+    def draw(self, canvas: 'skia.Canvas', layer: Layers = Layers.PROPS, draw_corners: bool = True) -> None:
+        """Draw the room and its props.
+        
+        Args:
+            canvas: The canvas to draw on
+            layer: The current drawing layer
+            draw_corners: Whether to draw the corner decorations on the PROPS
+                layer. Map.render passes False, as it draws the corners of
+                all rooms in a region in one batch.
+        """
         if layer == Layers.PROPS:
-            self.draw_corners(canvas)
+            if draw_corners:
+                self.draw_corners(canvas)
         elif layer == Layers.TEXT:
             self._draw_number(canvas)
         super().draw(canvas, layer)
@@ -197,7 +243,8 @@ class Room(MapElement):
             if cls._number_typeface is None:
                 raise RuntimeError(f"Failed to load font from: {font_path}")
             
-            print(f"[Room] Loaded font: {cls._number_typeface.getFamilyName()} from {font_path}")
+            logger.debug(LogTags.DEBUG, "[Room] Loaded font: %s from %s",
+                         cls._number_typeface.getFamilyName(), font_path)
         return cls._number_typeface
     
     def _draw_number(self, canvas: 'skia.Canvas') -> None:
@@ -2,11 +2,16 @@
 
 import math
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Set
 from dungeongen.map.enums import GridStyle
 
 _invalid_options: 'Options'
 
+# Crosshatch values cached from other options, dropped by Options.invalidate()
+_CROSSHATCH_DERIVED = ('crosshatch_poisson_radius', 'crosshatch_neighbor_radius',
+                       'crosshatch_stroke_length', 'min_crosshatch_stroke_length')
+
 @dataclass
 class Options:
     """Configuration options for the crosshatch pattern generator."""
@@ -26,22 +31,22 @@ class Options:
     crosshatch_stroke_spacing: float = 10
     crosshatch_angle_variation: float = math.radians(10)
     
-    @property
+    @cached_property
     def crosshatch_poisson_radius(self) -> float:
         """Radius for Poisson disk sampling of crosshatch clusters."""
         return self.crosshatch_stroke_spacing * (self.crosshatch_strokes_per_cluster - 1)
     
-    @property
+    @cached_property
     def crosshatch_neighbor_radius(self) -> float:
         """Radius for detecting neighboring crosshatch clusters."""
         return self.crosshatch_poisson_radius * 1.5
     
-    @property
+    @cached_property
     def crosshatch_stroke_length(self) -> float:
         """Base length of crosshatch strokes."""
         return self.crosshatch_poisson_radius * 2
     
-    @property
+    @cached_property
     def min_crosshatch_stroke_length(self) -> float:
         """Minimum allowed length for crosshatch strokes."""
         return self.crosshatch_stroke_length * 0.35
@@ -51,6 +56,29 @@ class Options:
         """Maximum random variation in crosshatch stroke length."""
         return 0.1
     
+    # Bumped by invalidate(); not an option itself
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def invalidate(self) -> None:
+        """Mark the options as changed after drawing has started.
+        
+        Drops the cached crosshatch values so they are recomputed from the
+        current settings, and bumps `revision` so caches built from option
+        values (paints, recorded prop pictures) are rebuilt. Call this after
+        changing any option, including in-place edits such as adding tags.
+        """
+        for name in _CROSSHATCH_DERIVED:
+            self.__dict__.pop(name, None)
+        self._revision += 1
+    
+    @property
+    def revision(self) -> int:
+        """Counter bumped by every invalidate() call.
+        
+        Caches built from option values compare it to tell when they are stale.
+        """
+        return self._revision
+    
     # Rendering options
     crosshatch_border_size: float = 24.0  # Size of crosshatched border around rooms
     crosshatch_background_color: int = 0xFFFFFFFF  # White
@@ -65,6 +93,7 @@ class Options:
     prop_stroke_width: float = 2.0  # Width of prop borders (thinner than door_stroke_width)
     room_shadow_offset_x: float = 6.0   # Shadow x offset in pixels (positive for left)
     room_shadow_offset_y: float = 8.0  # Shadow y offset in pixels (positive for up)
+    room_corner_antialias: bool = True  # Antialias room corner decorations (off is faster, rougher)
     
     # Grid options
     grid_style: 'GridStyle' = GridStyle.DOTS  # Grid drawing style using dots
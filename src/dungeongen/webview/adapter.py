@@ -641,13 +641,13 @@ def _convert_stair(layout_stair: LayoutStair, dungeon_map: 'Map', offset_x: int,
     
     # Try to find the passage at this location
     for passage in dungeon_map.passages:
-        if passage.shape.contains(map_x, map_y):
+        if passage.contains_point(map_x, map_y):
             passage.add_prop(stairs_prop)
             return
     
     # Fallback: try rooms (stairs might be in a room entrance)
     for room in dungeon_map.rooms:
-        if room.shape.contains(map_x, map_y):
+        if room.contains_point(map_x, map_y):
             room.add_prop(stairs_prop)
             return
     
@@ -769,13 +769,13 @@ def _decorate_room(room: 'Room', seed: int, toward_spine: str) -> None:
     # Random altars
     altar_roll = rng.random()
     if altar_roll < 0.05:
-        arrange_random_props(room, [PropType.ALTAR], min_count=1, max_count=1)
+        arrange_random_props(room, [PropType.ALTAR], min_count=1, max_count=1, rng=rng)
     elif altar_roll < 0.07:
-        arrange_random_props(room, [PropType.ALTAR], min_count=2, max_count=2)
+        arrange_random_props(room, [PropType.ALTAR], min_count=2, max_count=2, rng=rng)
     
     # Add rocks
-    arrange_random_props(room, [PropType.SMALL_ROCK], min_count=0, max_count=5)
-    arrange_random_props(room, [PropType.MEDIUM_ROCK], min_count=0, max_count=3)
+    arrange_random_props(room, [PropType.SMALL_ROCK], min_count=0, max_count=5, rng=rng)
+    arrange_random_props(room, [PropType.MEDIUM_ROCK], min_count=0, max_count=3, rng=rng)
 
 
 def render_dungeon_to_png(layout_dungeon: Dungeon, output_path: str = 'dungeon_output.png',
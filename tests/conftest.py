@@ -0,0 +1,27 @@
+"""Shared fixtures for dungeongen tests."""
+
+import pytest
+import skia
+
+from dungeongen.map.map import Map
+from dungeongen.options import Options
+
+
+@pytest.fixture
+def dungeon_map() -> Map:
+    """An empty map with default options."""
+    return Map(Options())
+
+
+@pytest.fixture
+def room(dungeon_map):
+    """A 3x3 cell rectangular room at the map origin."""
+    return dungeon_map.create_rectangular_room(0, 0, 3, 3)
+
+
+@pytest.fixture
+def surface() -> skia.Surface:
+    """A 200x200 pixel surface cleared to white."""
+    surface = skia.Surface(200, 200)
+    surface.getCanvas().clear(skia.ColorWHITE)
+    return surface
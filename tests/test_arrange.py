@@ -0,0 +1,50 @@
+"""Tests for prop and column arrangement."""
+
+import random
+
+from dungeongen.map.arrange import (arrange_columns, arrange_random_props,
+                                    ColumnArrangement, PropType)
+from dungeongen.map.map import Map
+from dungeongen.options import Options
+from dungeongen.webview.adapter import _decorate_room
+
+
+def _placement(room):
+    return [(prop.prop_type, tuple(prop.position), prop.rotation)
+            for prop in room.props]
+
+
+def _arranged_room(seed: int):
+    room = Map(Options()).create_rectangular_room(0, 0, 5, 5)
+    arrange_random_props(room, [PropType.SMALL_ROCK, PropType.MEDIUM_ROCK],
+                         min_count=3, max_count=6, rng=random.Random(seed))
+    return room
+
+
+def test_same_rng_seed_gives_same_placement():
+    first = _arranged_room(7)
+    # Disturb the global generator so only the passed rng can drive placement
+    random.seed(12345)
+    second = _arranged_room(7)
+
+    assert first.props
+    assert _placement(first) == _placement(second)
+
+
+def test_decorate_room_is_reproducible_for_a_seed():
+    placements = []
+    for global_seed in (1, 2):
+        random.seed(global_seed)
+        room = Map(Options()).create_rectangular_room(0, 0, 6, 6)
+        _decorate_room(room, 7, 'north')
+        placements.append(_placement(room))
+
+    assert placements[0]
+    assert placements[0] == placements[1]
+
+
+def test_fractional_margin_keeps_cells_left_after_truncation(room):
+    # 3x3 room, margin 0.75: the placement bounds 1.75..1.25 still hold cell 1
+    columns = arrange_columns(room, ColumnArrangement.GRID, margin=0.75)
+
+    assert len(columns) == 1
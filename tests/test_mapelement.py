@@ -0,0 +1,48 @@
+"""Tests for map element prop management."""
+
+import pytest
+
+from dungeongen.map.props import Column
+
+
+@pytest.fixture
+def big_room(dungeon_map):
+    return dungeon_map.create_rectangular_room(0, 0, 5, 5)
+
+
+def _columns(room, count: int):
+    return [Column.create_round(room.bounds.x + 20 + 40 * i, room.bounds.y + 20)
+            for i in range(count)]
+
+
+def test_add_props_attaches_every_prop(dungeon_map, big_room):
+    columns = _columns(big_room, 3)
+
+    big_room.add_props(columns)
+
+    assert list(big_room.props) == columns
+    for column in columns:
+        assert column.container is big_room
+        assert column.map is dungeon_map
+
+
+def test_add_props_rerecords_props_picture(big_room):
+    big_room.add_props(_columns(big_room, 1))
+    picture = big_room.get_props_picture()
+
+    big_room.add_props(_columns(big_room, 2))
+
+    assert big_room.prop_count == 3
+    assert big_room.get_props_picture() is not picture
+
+
+def test_add_props_moves_props_from_previous_container(dungeon_map, big_room):
+    target = dungeon_map.create_rectangular_room(10, 0, 5, 5)
+    columns = _columns(big_room, 2)
+    big_room.add_props(columns)
+
+    target.add_props(columns)
+
+    assert not big_room.props
+    assert list(target.props) == columns
+    assert all(column.container is target for column in columns)
@@ -0,0 +1,38 @@
+"""Tests for option change tracking."""
+
+from dungeongen.options import Options
+
+
+def test_invalidate_recomputes_cached_crosshatch_values():
+    options = Options()
+    radius = options.crosshatch_poisson_radius
+    length = options.min_crosshatch_stroke_length
+
+    options.crosshatch_stroke_spacing *= 2
+    options.invalidate()
+
+    assert options.crosshatch_poisson_radius == radius * 2
+    assert options.min_crosshatch_stroke_length == length * 2
+
+    options.crosshatch_strokes_per_cluster = 5
+    options.invalidate()
+    assert options.crosshatch_poisson_radius == options.crosshatch_stroke_spacing * 4
+    assert options.crosshatch_neighbor_radius == options.crosshatch_poisson_radius * 1.5
+
+
+def test_invalidate_bumps_revision():
+    options = Options()
+    revision = options.revision
+
+    options.tags.add('cave')
+    options.invalidate()
+
+    assert options.revision == revision + 1
+
+
+def test_revision_is_not_an_option():
+    options = Options()
+    options.invalidate()
+
+    assert options == Options()
+    assert 'revision' not in repr(options)
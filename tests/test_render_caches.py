@@ -0,0 +1,85 @@
+"""Tests for the paints and pictures cached between renders."""
+
+import pytest
+import skia
+
+from dungeongen.debug_config import debug_draw, DebugDrawFlags
+from dungeongen.map.props import Altar, Column
+
+
+@pytest.fixture
+def column(room):
+    column = Column.create_round(room.bounds.x + 20, room.bounds.y + 20)
+    room.add_prop(column)
+    return column
+
+
+def test_props_picture_is_reused_while_nothing_changes(room, column):
+    assert room.get_props_picture() is room.get_props_picture()
+
+
+def test_props_picture_rerecorded_after_options_invalidate(dungeon_map, room, column):
+    picture = room.get_props_picture()
+
+    dungeon_map.options.prop_outline_color = 0xFFFF0000
+    dungeon_map.options.invalidate()
+
+    assert room.get_props_picture() is not picture
+
+
+def test_props_picture_rerecorded_when_grid_bounds_debug_toggles(room, column):
+    picture = room.get_props_picture()
+
+    debug_draw.enable(DebugDrawFlags.GRID_BOUNDS)
+    try:
+        assert room.get_props_picture() is not picture
+    finally:
+        debug_draw.disable(DebugDrawFlags.GRID_BOUNDS)
+
+
+def test_props_picture_rerecorded_after_bounds_change(room, column):
+    picture = room.get_props_picture()
+
+    room.shape.translate(64, 0)
+    room.recalculate_bounds()
+
+    assert room.get_props_picture() is not picture
+
+
+def test_props_picture_rerecorded_when_a_prop_moves(room, column):
+    picture = room.get_props_picture()
+
+    column.position = (room.bounds.x + 60, room.bounds.y + 60)
+
+    assert room.get_props_picture() is not picture
+
+
+def test_props_picture_draws_props_in_insertion_order(room, surface):
+    # Overlapping props of alternating classes
+    first = Column.create_round(room.bounds.x + 40, room.bounds.y + 40)
+    altar = Altar.create()
+    altar.position = (room.bounds.x + 40, room.bounds.y + 40)
+    last = Column.create_round(room.bounds.x + 70, room.bounds.y + 50)
+    room.add_props([first, altar, last])
+
+    surface.getCanvas().drawPicture(room.get_props_picture())
+
+    expected = skia.Surface(200, 200)
+    expected.getCanvas().clear(skia.ColorWHITE)
+    for prop in room.props:
+        prop.draw(expected.getCanvas())
+    assert (surface.makeImageSnapshot().toarray() ==
+            expected.makeImageSnapshot().toarray()).all()
+
+
+def test_map_paints_follow_options_invalidate(dungeon_map):
+    step_paint = dungeon_map.step_paint
+    assert dungeon_map.step_paint is step_paint
+
+    dungeon_map.options.border_width = 2.0
+    dungeon_map.options.invalidate()
+    assert dungeon_map.step_paint.getStrokeWidth() == 1.0
+
+    dungeon_map.options.room_corner_antialias = False
+    dungeon_map.options.invalidate()
+    assert not dungeon_map.corner_paint.isAntiAlias()
@@ -0,0 +1,23 @@
+"""Tests for rock drawing."""
+
+import skia
+
+from dungeongen.map._props.rock import Rock
+
+
+def test_rock_batch_matches_individual_draws(room, surface):
+    # Overlapping rocks, so a later rock must cover the outline of an earlier one
+    rocks = [Rock((room.bounds.x + 40, room.bounds.y + 40), 12),
+             Rock((room.bounds.x + 50, room.bounds.y + 46), 12),
+             Rock((room.bounds.x + 90, room.bounds.y + 60), 8)]
+    for rock in rocks:
+        room.add_prop(rock)
+
+    Rock.draw_batch(surface.getCanvas(), rocks)
+
+    expected = skia.Surface(200, 200)
+    expected.getCanvas().clear(skia.ColorWHITE)
+    for rock in rocks:
+        rock.draw(expected.getCanvas())
+    assert (surface.makeImageSnapshot().toarray() ==
+            expected.makeImageSnapshot().toarray()).all()
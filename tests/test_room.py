@@ -0,0 +1,46 @@
+"""Tests for room drawing."""
+
+import skia
+
+from dungeongen.constants import CELL_SIZE
+from dungeongen.map.enums import Layers
+from dungeongen.map.room import CORNER_INSET
+
+
+def _dark_pixels(surface: skia.Surface) -> int:
+    return int((surface.makeImageSnapshot().toarray()[..., 0] < 128).sum())
+
+
+def _recorded_ops(room, cull_rect: skia.Rect) -> int:
+    recorder = skia.PictureRecorder()
+    room.draw(recorder.beginRecording(cull_rect), Layers.PROPS)
+    return recorder.finishRecordingAsPicture().approximateOpCount()
+
+
+def test_room_draw_draws_corners(room, surface):
+    room.draw(surface.getCanvas(), Layers.PROPS)
+
+    assert _dark_pixels(surface) > 0
+
+
+def test_room_draw_can_leave_corners_to_the_caller(room, surface):
+    room.draw(surface.getCanvas(), Layers.PROPS, draw_corners=False)
+
+    assert _dark_pixels(surface) == 0
+
+
+def test_map_render_draws_room_corners(dungeon_map):
+    room = dungeon_map.create_rectangular_room(1, 1, 3, 3)
+    surface = skia.Surface(320, 320)
+
+    dungeon_map.render(surface.getCanvas(), skia.Matrix())
+
+    # Just inside the top-left corner decoration
+    inside = int(CORNER_INSET * CELL_SIZE) + 2
+    pixels = surface.makeImageSnapshot().toarray()
+    assert pixels[int(room.bounds.y) + inside, int(room.bounds.x) + inside, 0] < 128
+
+
+def test_room_draw_skips_corners_outside_the_clip(room):
+    assert _recorded_ops(room, skia.Rect.MakeWH(400, 400)) > 0
+    assert _recorded_ops(room, skia.Rect.MakeXYWH(1000, 1000, 100, 100)) == 0
@@ -0,0 +1,59 @@
+"""Tests for shape containment."""
+
+from dungeongen.graphics.shapes import Circle, Rectangle, ShapeGroup
+
+
+def _exact_contains(group: ShapeGroup, px: float, py: float) -> bool:
+    """Containment straight from the includes/excludes, without any raster."""
+    return (any(shape.contains(px, py) for shape in group.includes) and
+            not any(shape.contains(px, py) for shape in group.excludes))
+
+
+def _sample_points(group: ShapeGroup, steps: int = 40):
+    bounds = group.bounds
+    for i in range(steps + 1):
+        for j in range(steps + 1):
+            yield (bounds.x + bounds.width * i / steps,
+                   bounds.y + bounds.height * j / steps)
+
+
+def test_accelerated_contains_matches_exact_after_add_exclude():
+    group = ShapeGroup(includes=[Rectangle(0, 0, 100, 100)], excludes=[])
+    group.path  # Cache the path before mutating the group
+    group.add_exclude(Rectangle(20, 20, 60, 60))
+    group.accelerate()
+
+    assert not group.contains(50, 50)
+    for px, py in _sample_points(group):
+        assert group.contains(px, py) == _exact_contains(group, px, py)
+
+
+def test_accelerated_contains_matches_exact_after_translate():
+    group = ShapeGroup(includes=[Rectangle(0, 0, 100, 100)],
+                       excludes=[Rectangle(20, 20, 60, 60)])
+    group.accelerate()
+    group.translate(35, 0)
+    group.accelerate()
+
+    for px, py in _sample_points(group):
+        assert group.contains(px, py) == _exact_contains(group, px, py)
+
+
+def test_accelerated_contains_matches_exact_after_remove_include():
+    first = Rectangle(0, 0, 50, 50)
+    second = Rectangle(50, 0, 50, 50)
+    group = ShapeGroup(includes=[first, second], excludes=[])
+    group.accelerate()
+    group.remove_include(second)
+    group.accelerate()
+
+    assert not group.contains(75, 25)
+    for px, py in _sample_points(group):
+        assert group.contains(px, py) == _exact_contains(group, px, py)
+
+
+def test_circle_deflated_below_zero_contains_nothing():
+    circle = Circle(50, 50, 10).inflated(-15)
+
+    assert not circle.contains(50, 50)
+    assert not circle.contains(51, 50)